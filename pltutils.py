@@ -1,9 +1,18 @@
+import numpy as np
+from matplotlib import RcParams
 from matplotlib import pyplot as plt
-from enum import Enum
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
+from matplotlib.patches import PathPatch
+from matplotlib.path import Path
+from enum import IntEnum
+from functools import lru_cache
+from cycler import cycler
 """
 Author: Eurka
 Version: 0.2.0
 ChangeLogs:
+    2026-10-15 v0.2.4 优化全局绘图参数设置
     2023-04-10 v0.2.3 精简代码
     2023-03-30 v0.2.2 新增绘制标记点的功能
     2023-03-30 v0.2.1 支持一次绘制多条辅助线
@@ -12,7 +21,7 @@ ChangeLogs:
 """
 
 
-class Style(Enum):
+class Style(IntEnum):
     SETE = 0
     NILOU = 1
     HUTAO = 2
@@ -20,37 +29,75 @@ class Style(Enum):
     N = 4
 
 
+# 预先构建各配色方案的 cycler，颜色提前转换为 RGBA，避免每次设置时解析字符串
+_STYLE_CYCLERS = {
+    style: cycler("color", [to_rgba("#" + c) for c in colors])
+    for style, colors in {
+        # 青 品红 橙 黄 紫 蓝 棕
+        Style.SETE: ["1fa89d", "e72d5c", "ff7800", "fabb0b", "9832c3", "4a57a4", "a77c4f"],
+        Style.NILOU: ["15365e", "76a1b9", "bed9e5", "65588a", "d75038"],
+        Style.HUTAO: ["65588a", "c94737", "3a1b19", "7b595e", "c7a085"],
+        Style.RAIDEN: ["352660", "553b93", "9772ca", "f5e7ec", "60203c"],
+        Style.N: ["352660", "6e0f6c", "9772ca", "f5e7ec", "60203c"],
+    }.items()
+}
+
+# 与配色无关的全局绘图参数，一次性批量写入 rcParams
+_BASE_PARAMS = {
+    # === 设置matplotlib对中文的支持 ===
+    "font.sans-serif": ["Microsoft YaHei"],
+    # === 设置绘图的字体大小 ===
+    "axes.titlesize": 14,
+    "axes.labelsize": 16,
+    "xtick.labelsize": 16,
+    "ytick.labelsize": 16,
+    "legend.fontsize": 14,
+    "figure.figsize": (8.0, 6.0),
+    # === 设置绘图的图例位置 ===
+    "legend.loc": "upper right",
+    # === 加速长曲线的渲染，出版级绘图可自行覆盖 ===
+    "path.simplify": True,
+    "path.simplify_threshold": 1.0,
+    "agg.path.chunksize": 10000,
+}
+
+# 经 matplotlib 校验后的全局绘图参数，用于判断当前 rcParams 是否已应用
+_BASE_RC = RcParams(_BASE_PARAMS)
+
+
+def _style_applied(prop_cycle):
+    """判断当前 rcParams 是否已应用给定的配色及全局绘图参数
+    """
+    return (plt.rcParams["axes.prop_cycle"] == prop_cycle
+            and all(plt.rcParams[k] == v for k, v in _BASE_RC.items()))
+
+
 def plt_style_init(style=Style.SETE):
     """设置 matplotlib.pyplot 的全局绘图参数
     """
-    # === 设置matplotlib对中文的支持 ===
-    plt.rcParams["font.sans-serif"] = ["Microsoft YaHei"]
-    # === 设置绘图的字体大小 ===
-    plt.rcParams["axes.titlesize"] = 14
-    plt.rcParams["axes.labelsize"] = 16
-    plt.rcParams["xtick.labelsize"] = 16
-    plt.rcParams["ytick.labelsize"] = 16
-    plt.rcParams["legend.fontsize"] = 14
-    plt.rcParams["figure.figsize"] = "8, 6"
+    prop_cycle = _STYLE_CYCLERS.get(style, _STYLE_CYCLERS[Style.SETE])
+    # 当前 rcParams 已是该配色方案时跳过重复的初始化
+    if _style_applied(prop_cycle):
+        return
+    plt.rcParams.update(_BASE_PARAMS)
     # === 设置绘图的配色 ===
-    if style == Style.SETE:
-        # 青 品红 橙 黄 紫 蓝 棕
-        plt.rcParams[
-            "axes.prop_cycle"] = "cycler('color', ['1fa89d','e72d5c','ff7800','fabb0b','9832c3','4a57a4','a77c4f'])"
-    elif style == Style.NILOU:
-        plt.rcParams[
-            "axes.prop_cycle"] = "cycler('color', ['#15365e','#76a1b9','#bed9e5','#65588a','#d75038'])"
-    elif style == Style.HUTAO:
-        plt.rcParams[
-            "axes.prop_cycle"] = "cycler('color', ['#65588a','#c94737','#3a1b19','#7b595e','#c7a085'])"
-    elif style == Style.RAIDEN:
-        plt.rcParams[
-            "axes.prop_cycle"] = "cycler('color', ['#352660','#553b93','#9772ca','#f5e7ec','#60203c'])"
-    elif style == Style.N:
-        plt.rcParams[
-            "axes.prop_cycle"] = "cycler('color', ['#352660','#6e0f6c','#9772ca','#f5e7ec','#60203c'])"
-    # === 设置绘图的图例位置 ===
-    plt.rcParams["legend.loc"] = "upper right"
+    plt.rcParams["axes.prop_cycle"] = prop_cycle
+
+
+@lru_cache(maxsize=256)
+def _build_plt_title(ans: str,
+                     vars: str | tuple[str, str],
+                     params: tuple[tuple[str, str], ...] | None):
+    """生成 post2d 的标题，相同参数的重复调用直接返回缓存结果
+    """
+    if isinstance(vars, str):
+        title = f"${ans}$ vs ${vars}$"
+    else:
+        title = f"${ans}$ vs (${vars[0]},~{vars[1]}$)"
+    if params is not None:
+        params_str = ",~".join(f"{k}={v}" for (k, v) in params)
+        title += f" when ${params_str}$"
+    return title
 
 
 def post2d(ans: str,
@@ -75,20 +122,21 @@ def post2d(ans: str,
     post2d("y_i", ["x", r"y_{idx}"], {"idx": "1,2,3,4,5"})
         y_i vs (x, y_idx) when idx=1,2,3,4,5
     """
+    ax = plt.gca()
     if isinstance(vars, str):
-        title = f"${ans}$ vs ${vars}$"
-        plt.xlabel(f"${vars}$")
-        plt.ylabel(f"${ans}$")
+        ax.set_xlabel(f"${vars}$")
+        ax.set_ylabel(f"${ans}$")
     else:
-        title = f"${ans}$ vs (${vars[0]},~{vars[1]}$)"
-        plt.xlabel(f"${vars[0]}$")
-        plt.ylabel(f"${vars[1]}$")
+        vars = tuple(vars)
+        ax.set_xlabel(f"${vars[0]}$")
+        ax.set_ylabel(f"${vars[1]}$")
     if params is not None:
-        params_str = ",~".join([f"{k}={v}" for (k, v) in params.items()])
-        title += f" when ${params_str}$"
-    plt.title(title)
+        # 标题只用到参数的字符串形式，以此作为缓存键以支持不可哈希的参数值
+        params = tuple((k, str(v)) for (k, v) in params.items())
+    ax.set_title(_build_plt_title(ans, vars, params))
     if hasLabel:
-        plt.legend()
+        # 每次重建图例，以反映 artist 样式及 legend.* 参数的变化
+        ax.legend()
 
 
 def line(x1y1: tuple[float, float],
@@ -129,14 +177,18 @@ def line_vertical(x: float | list[float], color="black", style="--"):
     style : str, optional
         辅助线样式, by default "--"
     """
-    y_arr = plt.ylim()
-    if isinstance(x, list):
-        for xi in x:
-            plt.plot([xi] * 2, y_arr, c=color, ls=style)
+    # 辅助线以坐标轴比例跨满 y 方向，不会引起 y 轴方向坐标轴扩展
+    ax = plt.gca()
+    if np.ndim(x) > 0:
+        # 多条辅助线合并为一个 LineCollection 绘制
+        segs = [[(xi, 0), (xi, 1)] for xi in x]
+        ax.add_collection(
+            LineCollection(segs,
+                           colors=color,
+                           linestyles=style,
+                           transform=ax.get_xaxis_transform()))
     else:
-        plt.plot([x] * 2, y_arr, c=color, ls=style)
-    # 避免y轴方向坐标轴扩展
-    plt.ylim(y_arr)
+        ax.axvline(x, c=color, ls=style)
 
 
 def line_horizontal(y: float | list[float], color="black", style="--"):
@@ -155,14 +207,18 @@ def line_horizontal(y: float | list[float], color="black", style="--"):
     style : str, optional
         辅助线样式, by default "--"
     """
-    x_arr = plt.xlim()
-    if isinstance(y, list):
-        for yi in y:
-            plt.plot(x_arr, [yi] * 2, c=color, ls=style)
+    # 辅助线以坐标轴比例跨满 x 方向，不会引起 x 轴方向坐标轴扩展
+    ax = plt.gca()
+    if np.ndim(y) > 0:
+        # 多条辅助线合并为一个 LineCollection 绘制
+        segs = [[(0, yi), (1, yi)] for yi in y]
+        ax.add_collection(
+            LineCollection(segs,
+                           colors=color,
+                           linestyles=style,
+                           transform=ax.get_yaxis_transform()))
     else:
-        plt.plot(x_arr, [y] * 2, c=color, ls=style)
-    # 避免x轴方向坐标轴扩展
-    plt.xlim(x_arr)
+        ax.axhline(y, c=color, ls=style)
 
 
 def mark_point(xy: tuple[float, float],
@@ -185,14 +241,25 @@ def mark_point(xy: tuple[float, float],
     style : str, optional
         辅助线样式, by default "--"
     """
-    x_arr = plt.xlim()
-    y_arr = plt.ylim()
-    plt.scatter(xy[0], xy[1], s=size, c=pcolor)
-    plt.plot([x_arr[0], xy[0]], [xy[1], xy[1]], c=lcolor, ls=style)
-    plt.plot([xy[0], xy[0]], [y_arr[0], xy[1]], c=lcolor, ls=style)
+    ax = plt.gca()
+    x_arr = ax.get_xlim()
+    y_arr = ax.get_ylim()
     # 避免坐标轴扩展
-    plt.xlim(x_arr)
-    plt.ylim(y_arr)
+    ax.set_autoscale_on(False)
+    ax.scatter(xy[0], xy[1], s=size, c=pcolor, zorder=3)
+    # 两条辅助线合并为一个 Path 绘制，各自作为子路径以保持虚线起点不变
+    verts = [(x_arr[0], xy[1]), (xy[0], xy[1]), (xy[0], y_arr[0]), (xy[0], xy[1])]
+    codes = [Path.MOVETO, Path.LINETO, Path.MOVETO, Path.LINETO]
+    ax.add_patch(
+        PathPatch(Path(verts, codes),
+                  fill=False,
+                  edgecolor=lcolor,
+                  linestyle=style,
+                  linewidth=plt.rcParams["lines.linewidth"],
+                  joinstyle=plt.rcParams["lines.dash_joinstyle"],
+                  capstyle=plt.rcParams["lines.dash_capstyle"],
+                  label="_nolegend_",
+                  zorder=2))
 
 
 if __name__ == "__main__":
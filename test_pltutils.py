@@ -0,0 +1,104 @@
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pytest
+from matplotlib.colors import to_rgba
+from matplotlib import pyplot as plt
+
+from .pltutils import (_STYLE_CYCLERS, Style, line_horizontal, line_vertical,
+                       plt_style_init, post2d)
+
+
+@pytest.fixture(autouse=True)
+def _isolate_rcparams():
+    with plt.rc_context():
+        yield
+    plt.close("all")
+
+
+def test_plt_style_init_reapplies_after_rcdefaults():
+    plt_style_init(Style.NILOU)
+    plt.rcdefaults()
+    plt_style_init(Style.NILOU)
+    assert plt.rcParams["axes.titlesize"] == 14
+    assert plt.rcParams["axes.prop_cycle"] == _STYLE_CYCLERS[Style.NILOU]
+
+
+def test_plt_style_init_reapplies_after_rc_context():
+    plt.rcdefaults()
+    with plt.rc_context():
+        plt_style_init(Style.HUTAO)
+    plt_style_init(Style.HUTAO)
+    assert plt.rcParams["axes.titlesize"] == 14
+    assert plt.rcParams["axes.prop_cycle"] == _STYLE_CYCLERS[Style.HUTAO]
+
+
+def test_line_vertical_list_extends_x_only():
+    fig, ax = plt.subplots()
+    ax.plot([1, 10], [1, 9])
+    y_arr = ax.get_ylim()
+    line_vertical([0, 12])
+    x_arr = ax.get_xlim()
+    assert x_arr[0] < 0 and x_arr[1] > 12
+    assert ax.get_ylim() == y_arr
+
+
+def test_line_horizontal_list_extends_y_only():
+    fig, ax = plt.subplots()
+    ax.plot([1, 10], [1, 9])
+    x_arr = ax.get_xlim()
+    line_horizontal([0, 12])
+    y_arr = ax.get_ylim()
+    assert y_arr[0] < 0 and y_arr[1] > 12
+    assert ax.get_xlim() == x_arr
+
+
+@pytest.mark.parametrize("xs", [(2, 3), np.array([2., 3.])])
+def test_line_vertical_sequence(xs):
+    fig, ax = plt.subplots()
+    ax.plot([1, 10], [1, 9])
+    line_vertical(xs)
+    assert len(ax.collections) == 1
+    assert len(ax.collections[0].get_segments()) == 2
+
+
+@pytest.mark.parametrize("ys", [(2, 3), np.array([2., 3.])])
+def test_line_horizontal_sequence(ys):
+    fig, ax = plt.subplots()
+    ax.plot([1, 10], [1, 9])
+    line_horizontal(ys)
+    assert len(ax.collections) == 1
+    assert len(ax.collections[0].get_segments()) == 2
+
+
+def test_post2d_title():
+    fig, ax = plt.subplots()
+    post2d("y_i", ["x", r"y_{idx}"], {"idx": "1,2,3,4,5"}, hasLabel=False)
+    assert ax.get_title() == r"$y_i$ vs ($x,~y_{idx}$) when $idx=1,2,3,4,5$"
+
+
+def test_post2d_unhashable_params():
+    fig, ax = plt.subplots()
+    post2d("y", "x", {"idx": [1, 2, 3]}, hasLabel=False)
+    assert ax.get_title() == "$y$ vs $x$ when $idx=[1, 2, 3]$"
+
+
+def test_post2d_legend_follows_restyled_artist():
+    fig, ax = plt.subplots()
+    line, = ax.plot([1, 2], [1, 2], label="a", color="blue")
+    post2d("y", "x")
+    line.set_color("red")
+    post2d("y", "x")
+    handle = ax.get_legend().legend_handles[0]
+    assert to_rgba(handle.get_color()) == to_rgba("red")
+
+
+def test_post2d_legend_includes_new_containers():
+    fig, ax = plt.subplots()
+    ax.plot([1, 2], [1, 2], label="a")
+    post2d("y", "x")
+    ax.bar([1, 2], [1, 2], label="bars")
+    post2d("y", "x")
+    assert [t.get_text() for t in ax.get_legend().get_texts()] == ["a", "bars"]